@@ -17,10 +17,12 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import urllib.parse
 import warnings
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator
 
 import attr
 
@@ -41,6 +43,17 @@ def normalize_noop(parts: SplitResult) -> SplitResult:
     return parts
 
 
+# Matches URIs that sanitization would return unchanged, as long as the scheme
+# has no provider normalizer: lower-case scheme, no auth info, a non-empty
+# path without a trailing slash, and no query or fragment.
+_CLEAN_URI_RE = re.compile(r"([a-z][a-z0-9+.\-]*)://[^/?#@\[\]\s]+/[^?#@\s]*[^/?#@\s]")
+
+# Matches queries where every pair has exactly one "=" and a non-empty value,
+# made only of characters that parse_qsl and urlencode leave untouched. Such
+# queries can be normalized by sorting the pairs without a round-trip.
+_SIMPLE_QUERY_RE = re.compile(r"[\w.~-]*=[\w.~-]+(?:&[\w.~-]*=[\w.~-]+)*", re.ASCII)
+
+
 def _get_uri_normalizer(scheme: str) -> Callable[[SplitResult], SplitResult] | None:
     if scheme == "file":
         return normalize_noop
@@ -49,11 +62,48 @@ def _get_uri_normalizer(scheme: str) -> Callable[[SplitResult], SplitResult] | N
     return ProvidersManager().dataset_uri_handlers.get(scheme)
 
 
-def _sanitize_uri(uri: str) -> str:
+def _sanitize_uri(uri: str, *, max_length: int | None = None) -> str:
     """Sanitize a dataset URI.
 
     This checks for URI validity, and normalizes the URI if needed. A fully
     normalized URI is returned.
+
+    The same URIs tend to be referenced repeatedly across DAGs, so the actual
+    normalization is memoized. Warnings and strict AIP-60 validation are
+    handled here on every call, so they do not depend on whether the URI has
+    been seen before in this process.
+    """
+    normalized, auth_dropped, noncompliance = _normalize_uri_cached(uri)
+    if auth_dropped:
+        # TODO: Collect this into a DagWarning.
+        warnings.warn(
+            "A dataset URI should not contain auth info (e.g. username or "
+            "password). It has been automatically dropped.",
+            UserWarning,
+            stacklevel=3,
+        )
+    if noncompliance is not None:
+        if conf.getboolean("core", "strict_dataset_uri_validation", fallback=False):
+            _normalize_uri(uri, strict=True)  # Re-run to raise the normalizer's own error.
+        warnings.warn(
+            f"The dataset URI {uri} is not AIP-60 compliant: {noncompliance}. "
+            f"In Airflow 3, this will raise an exception.",
+            UserWarning,
+            stacklevel=3,
+        )
+    if max_length is not None and len(normalized) > max_length:
+        raise ValueError(f"Length of 'uri' must be <= {max_length}: {len(normalized)}")
+    return normalized
+
+
+def _normalize_uri(uri: str, *, strict: bool = False) -> tuple[str, bool, str | None]:
+    """Normalize a dataset URI without emitting warnings.
+
+    Return the normalized URI, whether auth info was dropped, and why the
+    provider normalizer rejected the URI, if it did. With *strict*, the
+    normalizer's error is raised instead.
+
+    :meta private:
     """
     if not uri:
         raise ValueError("Dataset URI cannot be empty")
@@ -61,47 +111,73 @@ def _sanitize_uri(uri: str) -> str:
         raise ValueError("Dataset URI cannot be just whitespace")
     if not uri.isascii():
         raise ValueError("Dataset URI must only consist of ASCII characters")
+    if (match := _CLEAN_URI_RE.fullmatch(uri)) is not None:
+        scheme = match.group(1)
+        if scheme != "airflow" and _get_uri_normalizer(scheme) in (None, normalize_noop):
+            return uri, False, None
     parsed = urllib.parse.urlsplit(uri)
     if not parsed.scheme and not parsed.netloc:  # Does not look like a URI.
-        return uri
+        return uri, False, None
     normalized_scheme = parsed.scheme.lower()
     if normalized_scheme.startswith("x-"):
-        return uri
+        return uri, False, None
     if normalized_scheme == "airflow":
         raise ValueError("Dataset scheme 'airflow' is reserved")
+    # Track whether sanitization changes anything, so an already-normalized
+    # URI can be returned as-is instead of being put back together. Besides
+    # the components, urlsplit itself drops stray "?" and "#" delimiters and
+    # whitespace or control characters, and collapses an empty netloc.
+    changed = (
+        not parsed.netloc
+        or not uri.startswith(f"{normalized_scheme}://")
+        or not uri.isprintable()
+        or uri[-1] == " "
+        or "#" in uri
+        or ("?" in uri and not parsed.query)
+    )
     _, auth_exists, normalized_netloc = parsed.netloc.rpartition("@")
     if auth_exists:
-        # TODO: Collect this into a DagWarning.
-        warnings.warn(
-            "A dataset URI should not contain auth info (e.g. username or "
-            "password). It has been automatically dropped.",
-            UserWarning,
-            stacklevel=3,
-        )
-    if parsed.query:
-        normalized_query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query)))
-    else:
+        changed = True
+    if not parsed.query:
         normalized_query = ""
-    parsed = parsed._replace(
-        scheme=normalized_scheme,
-        netloc=normalized_netloc,
-        path=parsed.path.rstrip("/") or "/",  # Remove all trailing slashes.
-        query=normalized_query,
-        fragment="",  # Ignore any fragments.
-    )
+    elif _SIMPLE_QUERY_RE.fullmatch(parsed.query):
+        pairs = sorted(tuple(pair.split("=")) for pair in parsed.query.split("&"))
+        normalized_query = "&".join(f"{k}={v}" for k, v in pairs)
+    else:
+        normalized_query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query)))
+    normalized_path = parsed.path
+    if normalized_path.endswith("/"):  # Remove all trailing slashes.
+        normalized_path = normalized_path.rstrip("/")
+    normalized_path = normalized_path or "/"
+    if normalized_query != parsed.query or normalized_path != parsed.path:
+        changed = True
+    if changed:
+        parsed = parsed._replace(
+            scheme=normalized_scheme,
+            netloc=normalized_netloc,
+            path=normalized_path,
+            query=normalized_query,
+            fragment="",  # Ignore any fragments.
+        )
+    noncompliance = None
     if (normalizer := _get_uri_normalizer(normalized_scheme)) is not None:
         try:
-            parsed = normalizer(parsed)
+            normalized = normalizer(parsed)
         except ValueError as exception:
-            if conf.getboolean("core", "strict_dataset_uri_validation", fallback=False):
+            if strict:
                 raise
-            warnings.warn(
-                f"The dataset URI {uri} is not AIP-60 compliant: {exception}. "
-                f"In Airflow 3, this will raise an exception.",
-                UserWarning,
-                stacklevel=3,
-            )
-    return urllib.parse.urlunsplit(parsed)
+            noncompliance = str(exception)
+        else:
+            if normalized != parsed:
+                changed = True
+                parsed = normalized
+    if not changed:
+        return uri, bool(auth_exists), noncompliance
+    return urllib.parse.urlunsplit(parsed), bool(auth_exists), noncompliance
+
+
+# Normalization only depends on the URI, so it is safe to share across callers.
+_normalize_uri_cached = functools.lru_cache(maxsize=4096)(_normalize_uri)
 
 
 def coerce_to_uri(value: str | Dataset) -> str:
@@ -124,6 +200,8 @@ class BaseDataset:
     :meta private:
     """
 
+    __slots__ = ()
+
     def __or__(self, other: BaseDataset) -> DatasetAny:
         if not isinstance(other, BaseDataset):
             return NotImplemented
@@ -155,10 +233,7 @@ class BaseDataset:
 class Dataset(os.PathLike, BaseDataset):
     """A representation of data dependencies between workflows."""
 
-    uri: str = attr.field(
-        converter=_sanitize_uri,
-        validator=[attr.validators.min_len(1), attr.validators.max_len(3000)],
-    )
+    uri: str = attr.field(converter=functools.partial(_sanitize_uri, max_length=3000))
     extra: dict[str, Any] | None = None
 
     __version__: ClassVar[int] = 1
@@ -191,40 +266,50 @@ class Dataset(os.PathLike, BaseDataset):
 class _DatasetBooleanCondition(BaseDataset):
     """Base class for dataset boolean logic."""
 
-    agg_func: Callable[[Iterable], bool]
+    __slots__ = ("objects",)
 
     def __init__(self, *objects: BaseDataset) -> None:
         if not all(isinstance(o, BaseDataset) for o in objects):
             raise TypeError("expect dataset expressions in condition")
+        # Optimization: Splat nested conditions of the same kind, since e.g.
+        # X | (Y | Z) is equivalent to X | Y | Z. This keeps the tree shallow.
+        if any(isinstance(o, self.__class__) for o in objects):
+            flattened: list[BaseDataset] = []
+            for o in objects:
+                if isinstance(o, self.__class__):
+                    flattened.extend(o.objects)
+                else:
+                    flattened.append(o)
+            objects = tuple(flattened)
         self.objects = objects
 
-    def evaluate(self, statuses: dict[str, bool]) -> bool:
-        return self.agg_func(x.evaluate(statuses=statuses) for x in self.objects)
-
     def iter_datasets(self) -> Iterator[tuple[str, Dataset]]:
-        seen = set()  # We want to keep the first instance.
+        datasets: dict[str, Dataset] = {}
         for o in self.objects:
             for k, v in o.iter_datasets():
-                if k in seen:
-                    continue
-                yield k, v
-                seen.add(k)
+                datasets.setdefault(k, v)  # We want to keep the first instance.
+        return iter(datasets.items())
 
 
 class DatasetAny(_DatasetBooleanCondition):
     """Use to combine datasets schedule references in an "and" relationship."""
 
-    agg_func = any
+    __slots__ = ()
 
     def __or__(self, other: BaseDataset) -> DatasetAny:
         if not isinstance(other, BaseDataset):
             return NotImplemented
-        # Optimization: X | (Y | Z) is equivalent to X | Y | Z.
         return DatasetAny(*self.objects, other)
 
     def __repr__(self) -> str:
         return f"DatasetAny({', '.join(map(str, self.objects))})"
 
+    def evaluate(self, statuses: dict[str, bool]) -> bool:
+        for x in self.objects:
+            if x.evaluate(statuses=statuses):
+                return True
+        return False
+
     def as_expression(self) -> dict[str, Any]:
         """Serialize the dataset into its scheduling expression.
 
@@ -236,17 +321,22 @@ class DatasetAny(_DatasetBooleanCondition):
 class DatasetAll(_DatasetBooleanCondition):
     """Use to combine datasets schedule references in an "or" relationship."""
 
-    agg_func = all
+    __slots__ = ()
 
     def __and__(self, other: BaseDataset) -> DatasetAll:
         if not isinstance(other, BaseDataset):
             return NotImplemented
-        # Optimization: X & (Y & Z) is equivalent to X & Y & Z.
         return DatasetAll(*self.objects, other)
 
     def __repr__(self) -> str:
         return f"DatasetAll({', '.join(map(str, self.objects))})"
 
+    def evaluate(self, statuses: dict[str, bool]) -> bool:
+        for x in self.objects:
+            if not x.evaluate(statuses=statuses):
+                return False
+        return True
+
     def as_expression(self) -> Any:
         """Serialize the dataset into its scheduling expression.
 
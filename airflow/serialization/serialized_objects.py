@@ -916,10 +916,11 @@ class DependencyDetector:
             return
         if not dag.dataset_triggers:
             return
+        dag_id = dag.dag_id
         for uri, _ in dag.dataset_triggers.iter_datasets():
             yield DagDependency(
                 source="dataset",
-                target=dag.dag_id,
+                target=dag_id,
                 dependency_type="dataset",
                 dependency_id=uri,
             )